@@ -5,13 +5,14 @@ Tests all features including time-based clicking, hotkeys, and pause intervals.
 """
 
 import subprocess
+import socket
 import sys
 import os
 import time
 
 def run_uv_command(args, timeout=10):
     """Run a UV command with turbo_clicker.py and return the result."""
-    cmd = ["uv", "run", "--with", "pyautogui", "--with", "keyboard", "turbo_clicker.py"] + args
+    cmd = ["uv", "run", "--with", "pyautogui", "--with", "keyboard", "--with", "numpy", "turbo_clicker.py"] + args
     try:
         result = subprocess.run(cmd, capture_output=True, text=True, 
                               cwd=os.path.dirname(__file__), timeout=timeout)
@@ -19,6 +20,18 @@ def run_uv_command(args, timeout=10):
     except subprocess.TimeoutExpired:
         return None
 
+def start_uv_process(args):
+    """Start turbo_clicker.py in the background via UV (for agents)."""
+    cmd = ["uv", "run", "--with", "pyautogui", "--with", "keyboard", "--with", "numpy", "turbo_clicker.py"] + args
+    return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                            cwd=os.path.dirname(__file__))
+
+def find_free_port():
+    """Ask the OS for a free localhost TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
 def test_help():
     """Test the help output."""
     print("Testing --help option...")
@@ -34,7 +47,7 @@ def test_help():
         help_text = result.stdout.lower()
         features_to_check = [
             "duration", "emergency-hotkey", "pause-hotkey", 
-            "pause-interval", "f12", "f9"
+            "pause-interval", "f12", "f9", "verify"
         ]
         
         print("\nFeature availability check:")
@@ -82,6 +95,56 @@ def test_argument_validation():
             "name": "Time-based with pause interval",
             "args": ["--duration=60", "--pause-interval=10", "--turbo-mode", "--help"],
             "should_succeed": True
+        },
+        {
+            "name": "Verification without any sampling trigger",
+            "args": ["--clicks=10", "--x=400", "--y=300", "--verify", "--verify-interval=0"],
+            "should_succeed": False  # Should fail: nothing would ever be sampled
+        },
+        {
+            "name": "Agent and coordinator together",
+            "args": ["--agent", "--coordinator=127.0.0.1:47800", "--x=1", "--y=1"],
+            "should_succeed": False  # Should fail due to mutual exclusion
+        },
+        {
+            "name": "Coordinator without coordinates",
+            "args": ["--coordinator=127.0.0.1:47800", "--clicks=10"],
+            "should_succeed": False  # Should fail: agents cannot pick a position interactively
+        },
+        {
+            "name": "Coordinator with pause prompts",
+            "args": ["--coordinator=127.0.0.1:47800", "--x=1", "--y=1", "--pause-interval=5"],
+            "should_succeed": False  # Should fail: agents cannot answer prompts
+        },
+        {
+            "name": "Coordinator with a backend",
+            "args": ["--coordinator=127.0.0.1:47800", "--x=1", "--y=1", "--backend=sendinput"],
+            "should_succeed": False  # Should fail: each agent picks its own backend
+        },
+        {
+            "name": "Rate and delay together",
+            "args": ["--clicks=10", "--x=1", "--y=1", "--rate=100", "--delay=0.5"],
+            "should_succeed": False  # Should fail due to mutual exclusion
+        },
+        {
+            "name": "Line path without end point",
+            "args": ["--path=line", "--x=100", "--y=100"],
+            "should_succeed": False  # Should fail: line paths need --to
+        },
+        {
+            "name": "Grid path without region",
+            "args": ["--path=grid", "--step=10"],
+            "should_succeed": False  # Should fail: grid paths need --path-region
+        },
+        {
+            "name": "Path verification without an explicit region",
+            "args": ["--path=line", "--x=100", "--y=100", "--to=500,100", "--verify"],
+            "should_succeed": False  # Should fail: the default region is swept over
+        },
+        {
+            "name": "Malformed verification region",
+            "args": ["--clicks=10", "--verify", "--verify-region=10,10,5"],
+            "should_succeed": False  # Should fail: region needs four values
         }
     ]
     
@@ -198,7 +261,15 @@ def test_example_commands():
         ["--clicks=100", "--delay=0.001", "--help"],
         ["--duration=120", "--emergency-hotkey=f12", "--pause-hotkey=f9", "--help"],
         ["--clicks=1000", "--pause-interval=100", "--help"],
-        ["--duration=300", "--pause-interval=30", "--help"]
+        ["--duration=300", "--pause-interval=30", "--help"],
+        ["--x=400", "--y=300", "--verify", "--verify-every=500", "--help"],
+        ["--duration=60", "--verify", "--verify-region=390,290,20,20", "--verify-action=stop", "--help"],
+        ["--agent", "--listen=0.0.0.0:47800", "--help"],
+        ["--coordinator=10.0.0.5,10.0.0.6:47800", "--x=400", "--y=300", "--duration=60", "--rate=200", "--help"],
+        ["--path=grid", "--path-region=100,100,800,600", "--step=10", "--help"],
+        ["--path=line", "--x=100", "--y=500", "--to=900,500", "--path-mode=drag", "--duration=60", "--backend=sendinput", "--help"],
+        ["--path=spiral", "--x=640", "--y=360", "--radius=300", "--turns=10", "--path-mode=move", "--help"],
+        ["--path=grid", "--path-region=100,100,800,600", "--verify", "--verify-region=1000,50,20,20", "--help"]
     ]
     
     passed = 0
@@ -217,6 +288,226 @@ def test_example_commands():
     print(f"\nExample Commands: {passed}/{total} passed")
     return passed == total
 
+def test_coordinator_localhost():
+    """Run a coordinated job on several mock-backend agents on localhost."""
+    print("\n" + "="*50)
+    print("Testing Coordinator/Agent Mode (localhost, mock backend)")
+    print("="*50)
+    
+    ports = [find_free_port() for _ in range(3)]
+    agents = [start_uv_process(["--agent", f"--listen=127.0.0.1:{port}", "--backend=mock", "--once"])
+              for port in ports]
+    try:
+        agent_list = ",".join(f"127.0.0.1:{port}" for port in ports)
+        result = run_uv_command([f"--coordinator={agent_list}", "--x=10", "--y=20", "--clicks=5000",
+                                 "--start-delay=1", "--confirm"], timeout=60)
+    finally:
+        for agent in agents:
+            try:
+                agent.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                agent.kill()
+    
+    if result is None:
+        print("❌ FAIL: Coordinator timed out")
+        return False
+    
+    checks = {
+        "Exit code 0": result.returncode == 0,
+        "All agents reported": all(f"127.0.0.1:{port}: 5,000 clicks" in result.stdout for port in ports),
+        "Combined total": "Total clicks performed: 15,000" in result.stdout,
+        "All completed": "All agents completed successfully" in result.stdout,
+    }
+    for name, passed in checks.items():
+        print(f"  {'✅' if passed else '❌'} {name}")
+    if not all(checks.values()):
+        print(result.stdout)
+        print(result.stderr)
+    return all(checks.values())
+
+def test_motion_paths():
+    """Stream precomputed paths through the mock backend and check the point counts."""
+    print("\n" + "="*50)
+    print("Testing Motion Paths (mock backend)")
+    print("="*50)
+    
+    cases = [
+        {
+            "name": "Grid sweep (one pass)",
+            "args": ["--path=grid", "--path-region=0,0,100,100", "--step=10"],
+            "expect": "Total clicks performed: 100"
+        },
+        {
+            "name": "Line drag repeated to a million points",
+            "args": ["--path=line", "--x=0", "--y=0", "--to=999,0", "--step=1", "--path-mode=drag", "--clicks=1000000"],
+            "expect": "Total clicks performed: 1,000,000"
+        },
+        {
+            "name": "Bezier moves with a control point",
+            "args": ["--path=bezier", "--x=0", "--y=0", "--to=400,0", "--control=200,300", "--path-mode=move",
+                     "--clicks=5000", "--batch-size=64"],
+            "expect": "Total clicks performed: 5,000"
+        },
+        {
+            "name": "Spiral for one second",
+            "args": ["--path=spiral", "--x=500", "--y=500", "--radius=200", "--turns=8", "--duration=1"],
+            "expect": "Time duration completed successfully"
+        }
+    ]
+    
+    passed = 0
+    for case in cases:
+        result = run_uv_command(case["args"] + ["--backend=mock", "--confirm"], timeout=30)
+        if result and result.returncode == 0 and case["expect"] in result.stdout:
+            print(f"✅ PASS: {case['name']}")
+            passed += 1
+        else:
+            print(f"❌ FAIL: {case['name']}")
+            if result:
+                print(f"   Output: {result.stdout.strip()[-300:]}")
+                print(f"   Error: {result.stderr.strip()}")
+    
+    print(f"\nMotion Paths: {passed}/{len(cases)} passed")
+    return passed == len(cases)
+
+class FakeRegionGrabber:
+    """Region grabber returning a fixed pixel buffer, switched to a changed one after N grabs."""
+    def __init__(self, before, after, change_after):
+        self.before = before
+        self.after = after
+        self.change_after = change_after
+        self.grabs = 0
+    
+    def grab(self):
+        self.grabs += 1
+        return self.before if self.grabs <= self.change_after else self.after
+    
+    def close(self):
+        pass
+
+def test_click_verification():
+    """Check region matching and that a mismatch stops clicking (in-process, mock backend)."""
+    print("\n" + "="*50)
+    print("Testing Click Verification (in-process, mock backend)")
+    print("="*50)
+    
+    import turbo_clicker as tc
+    
+    pixel = bytes([100, 100, 100, 255])
+    checks = {
+        "Identical region matches": tc.region_matches(memoryview(pixel * 25), pixel * 25, 12),
+        "Small drift within tolerance": tc.region_matches(bytes([110, 110, 110, 255]) * 25, pixel * 25, 12),
+        "Drift beyond tolerance rejected": not tc.region_matches(bytes([113, 113, 113, 255]) * 25, pixel * 25, 12),
+        "Alpha byte ignored": tc.region_matches(bytes([100, 100, 100, 0]) * 25, pixel * 25, 12),
+    }
+    
+    grabber = FakeRegionGrabber(pixel * 25, bytes([0, 0, 255, 255]) * 25, change_after=3)
+    original_open = tc.open_region_grabber
+    tc.open_region_grabber = lambda *region: grabber
+    try:
+        backend = tc.MockBackend()
+        verifier = tc.ClickVerifier((0, 0, 5, 5), interval=0.01, action="stop")
+        stats = tc.turbo_click(2, 2, duration=5.0, verifier=verifier, verify_every=1000, backend=backend)
+    finally:
+        tc.open_region_grabber = original_open
+    
+    checks["Mismatch stopped the run"] = stats["elapsed"] < 2.0 and not stats["completed"]
+    checks["Stop reason reported"] = "no longer matches" in stats["stop_reason"]
+    checks["Cursor moved to target first"] = backend.moves >= 1
+    checks["Mismatch counted"] = verifier.mismatches >= 1
+    
+    for name, passed in checks.items():
+        print(f"  {'✅' if passed else '❌'} {name}")
+    return all(checks.values())
+
+def test_drag_stop_releases_button():
+    """Stop a slow drag mid-batch and check it ends promptly with the button released (in-process)."""
+    print("\n" + "="*50)
+    print("Testing Drag Stop (in-process, mock backend)")
+    print("="*50)
+    
+    import threading
+    import turbo_clicker as tc
+    
+    path = tc.line_path((0, 0), (5000, 0), 1)
+    backend = tc.MockBackend()
+    
+    def stop_soon():
+        time.sleep(0.5)
+        tc.emergency_stop = True
+    
+    threading.Thread(target=stop_soon, daemon=True).start()
+    stats = tc.turbo_click(0, 0, clicks=len(path), delay=0.005, backend=backend,
+                           path=path, path_mode="drag", batch_size=1000)
+    
+    checks = {
+        "Stopped within 1s": stats["elapsed"] < 1.0,
+        "Button released": not backend.button_down,
+    }
+    for name, passed in checks.items():
+        print(f"  {'✅' if passed else '❌'} {name}")
+    return all(checks.values())
+
+def test_agent_robustness():
+    """Send malformed messages to an in-process mock agent, then run a verified job on it."""
+    print("\n" + "="*50)
+    print("Testing Agent Robustness (in-process, mock backend)")
+    print("="*50)
+    
+    import json
+    import threading
+    import turbo_clicker as tc
+    
+    port = find_free_port()
+    threading.Thread(target=tc.run_agent, args=("127.0.0.1", port, "mock"), daemon=True).start()
+    
+    checks = {}
+    deadline = time.time() + 5
+    while True:
+        try:
+            sock = socket.create_connection(("127.0.0.1", port), timeout=5)
+            break
+        except OSError:
+            if time.time() >= deadline:
+                raise
+            time.sleep(0.05)
+    reader = sock.makefile("r", encoding="utf-8")
+    bad_messages = [
+        ("Non-object message rejected", [1]),
+        ("Job without payload rejected", {"type": "job"}),
+        ("Job without coordinates rejected", {"type": "job", "job": {"clicks": 10}, "start_at": 0}),
+    ]
+    for name, message in bad_messages:
+        sock.sendall((json.dumps(message) + "\n").encode("utf-8"))
+        reply = json.loads(reader.readline() or "{}")
+        checks[name] = reply.get("type") == "error"
+    sock.sendall(b'{"type": "ping"}\n')
+    checks["Agent still answers pings"] = json.loads(reader.readline() or "{}").get("type") == "pong"
+    reader.close()
+    sock.close()
+    
+    # Verification settings travel with the job and run on the agent
+    pixel = bytes([100, 100, 100, 255])
+    grabber = FakeRegionGrabber(pixel * 25, bytes([0, 0, 255, 255]) * 25, change_after=3)
+    original_open = tc.open_region_grabber
+    tc.open_region_grabber = lambda *region: grabber
+    try:
+        coordinator = tc.Coordinator([("127.0.0.1", port)])
+        coordinator.connect()
+        coordinator.dispatch({"x": 2, "y": 2, "clicks": None, "duration": 5.0, "delay": 0.0,
+                              "verify": {"interval": 0.01, "action": "stop"}}, start_delay=0.1)
+        coordinator.wait(timeout=10)
+        report = coordinator.report()
+        coordinator.close()
+    finally:
+        tc.open_region_grabber = original_open
+    checks["Agent survived bad messages"] = not report["agents"][0]["error"]
+    checks["Forwarded verification stopped the job"] = "no longer matches" in report["agents"][0]["stop_reason"]
+    
+    for name, passed in checks.items():
+        print(f"  {'✅' if passed else '❌'} {name}")
+    return all(checks.values())
+
 def print_summary(test_results):
     """Print a summary of all test results."""
     print("\n" + "="*60)
@@ -266,6 +557,17 @@ if __name__ == "__main__":
     example_result = test_example_commands()
     test_results.append(example_result)
     
+    print("\n🔧 Testing click verification...")
+    test_results.append(test_click_verification())
+    
+    print("\n🔧 Testing coordinator/agent mode...")
+    test_results.append(test_coordinator_localhost())
+    test_results.append(test_agent_robustness())
+    
+    print("\n🔧 Testing motion paths...")
+    test_results.append(test_motion_paths())
+    test_results.append(test_drag_stop_releases_button())
+    
     # Print comprehensive usage instructions
     print("\n" + "="*60)
     print("USAGE INSTRUCTIONS")
@@ -285,6 +587,13 @@ if __name__ == "__main__":
     print("   uv run --with pyautogui --with keyboard turbo_clicker.py --clicks=2000 --pause-interval=500")
     print("\n7. Specific Coordinates:")
     print("   uv run --with pyautogui --with keyboard turbo_clicker.py --x=640 --y=480 --clicks=1000")
+    print("\n8. On-screen Verification:")
+    print("   uv run --with pyautogui --with keyboard turbo_clicker.py --x=640 --y=480 --clicks=100000 --verify")
+    print("\n9. Multi-host (agent on each desktop, then one coordinator):")
+    print("   uv run --with pyautogui --with keyboard turbo_clicker.py --agent --listen=0.0.0.0:47800")
+    print("   uv run --with pyautogui --with keyboard turbo_clicker.py --coordinator=host1,host2 --x=640 --y=480 --duration=60")
+    print("\n10. Motion Paths (grid, line, bezier, spiral):")
+    print("   uv run --with pyautogui --with keyboard --with numpy turbo_clicker.py --path=grid --path-region=100,100,800,600 --step=10")
     
     print("\n🔥 Default Hotkeys:")
     print("   F12 = Emergency Stop (instant shutdown)")
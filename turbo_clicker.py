@@ -6,16 +6,34 @@ Features emergency hotkey kill switch and time-based clicking duration.
 """
 
 import argparse
+import json
+import math
+import socket
 import time
 import sys
 import threading
-from typing import Tuple, Optional
-import pyautogui as pg # pyright: ignore[reportMissingModuleSource]
+from typing import Any, Callable, Dict, List, Tuple, Optional
+try:
+    import pyautogui as pg # pyright: ignore[reportMissingModuleSource]
+    PYAUTOGUI_AVAILABLE = True
+except Exception:  # ImportError, or no display to attach to (e.g. headless agents using the mock backend)
+    PYAUTOGUI_AVAILABLE = False
 try:
     import keyboard # pyright: ignore[reportMissingModuleSource]
     KEYBOARD_AVAILABLE = True
 except ImportError:
     KEYBOARD_AVAILABLE = False
+try:
+    import numpy as np # pyright: ignore[reportMissingModuleSource]
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Exceptions that mean "PyAutoGUI failsafe tripped" (none when PyAutoGUI is missing)
+FAILSAFE_EXCEPTIONS = (pg.FailSafeException,) if PYAUTOGUI_AVAILABLE else ()
+
+# Default TCP port for coordinator/agent mode
+AGENT_DEFAULT_PORT = 47800
 
 # Global variables for emergency stop and pause control
 emergency_stop = False
@@ -68,6 +86,512 @@ def cleanup_hotkeys():
             pass
 
 
+class PyAutoGUIBackend:
+    """Deliver clicks to the real mouse through PyAutoGUI."""
+    name = "pyautogui"
+    max_batch = 50  # Works point by point (with PAUSE sleeps), so keep batches short for fast stop/pause
+
+    def __init__(self):
+        if not PYAUTOGUI_AVAILABLE:
+            raise RuntimeError("PyAutoGUI is not available. Install with: uv add pyautogui")
+        self.click = pg.click  # Bind directly so each click costs a single call
+
+    def click_batch(self, points) -> None:
+        """Click every (x, y) row of a point array."""
+        click = pg.click
+        for x, y in points.tolist():  # One conversion per batch instead of per-point NumPy scalars
+            click(x, y)
+
+    def move_batch(self, points) -> None:
+        """Move through every (x, y) row of a point array without tweening."""
+        move = pg.moveTo
+        for x, y in points.tolist():
+            move(x, y, _pause=False)
+
+    def move_to(self, x: int, y: int) -> None:
+        """Move the cursor to (x, y)."""
+        pg.moveTo(x, y)
+
+    def mouse_down(self, x: int, y: int) -> None:
+        """Press the left button at (x, y)."""
+        pg.mouseDown(x, y)
+
+    def mouse_up(self) -> None:
+        """Release the left button (even with the cursor in a failsafe corner)."""
+        failsafe = pg.FAILSAFE
+        pg.FAILSAFE = False
+        try:
+            pg.mouseUp()
+        finally:
+            pg.FAILSAFE = failsafe
+
+
+class SendInputBackend:
+    """Inject whole batches of mouse events with one Windows SendInput call each."""
+    name = "sendinput"
+    max_batch = None
+
+    MOUSEEVENTF_MOVE = 0x0001
+    MOUSEEVENTF_LEFTDOWN = 0x0002
+    MOUSEEVENTF_LEFTUP = 0x0004
+    MOUSEEVENTF_VIRTUALDESK = 0x4000
+    MOUSEEVENTF_ABSOLUTE = 0x8000
+
+    def __init__(self):
+        if sys.platform != 'win32':
+            raise RuntimeError("The sendinput backend only works on Windows")
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("The sendinput backend needs NumPy. Install with: uv add numpy")
+        import ctypes
+        from ctypes import wintypes
+
+        class MOUSEINPUT(ctypes.Structure):
+            _fields_ = [('dx', wintypes.LONG), ('dy', wintypes.LONG), ('mouseData', wintypes.DWORD),
+                        ('dwFlags', wintypes.DWORD), ('time', wintypes.DWORD), ('dwExtraInfo', ctypes.c_size_t)]
+
+        class KEYBDINPUT(ctypes.Structure):
+            _fields_ = [('wVk', wintypes.WORD), ('wScan', wintypes.WORD), ('dwFlags', wintypes.DWORD),
+                        ('time', wintypes.DWORD), ('dwExtraInfo', ctypes.c_size_t)]
+
+        class HARDWAREINPUT(ctypes.Structure):
+            _fields_ = [('uMsg', wintypes.DWORD), ('wParamL', wintypes.WORD), ('wParamH', wintypes.WORD)]
+
+        class INPUTUNION(ctypes.Union):
+            _fields_ = [('mi', MOUSEINPUT), ('ki', KEYBDINPUT), ('hi', HARDWAREINPUT)]
+
+        class INPUT(ctypes.Structure):
+            _fields_ = [('type', wintypes.DWORD), ('u', INPUTUNION)]
+
+        # NumPy view of the INPUT layout: a batch is filled with vectorized writes and passed as-is
+        union = INPUT.u.offset
+        self._input_dtype = np.dtype({
+            'names': ['type', 'dx', 'dy', 'flags'],
+            'formats': [np.uint32, np.int32, np.int32, np.uint32],
+            'offsets': [INPUT.type.offset, union + MOUSEINPUT.dx.offset,
+                        union + MOUSEINPUT.dy.offset, union + MOUSEINPUT.dwFlags.offset],
+            'itemsize': ctypes.sizeof(INPUT),
+        })
+        self._input_size = ctypes.sizeof(INPUT)
+        self._events = np.zeros(0, dtype=self._input_dtype)  # Reused between batches, grown on demand
+
+        user32 = ctypes.windll.user32  # type: ignore[attr-defined]
+        user32.SendInput.argtypes = [wintypes.UINT, ctypes.c_void_p, ctypes.c_int]
+        user32.SendInput.restype = wintypes.UINT
+        self._send_input = user32.SendInput
+        self._left = user32.GetSystemMetrics(76)  # SM_XVIRTUALSCREEN
+        self._top = user32.GetSystemMetrics(77)  # SM_YVIRTUALSCREEN
+        self._x_scale = 65535.0 / max(1, user32.GetSystemMetrics(78) - 1)  # SM_CXVIRTUALSCREEN
+        self._y_scale = 65535.0 / max(1, user32.GetSystemMetrics(79) - 1)  # SM_CYVIRTUALSCREEN
+        self._absolute = self.MOUSEEVENTF_MOVE | self.MOUSEEVENTF_ABSOLUTE | self.MOUSEEVENTF_VIRTUALDESK
+
+    def _buffer(self, count: int):
+        if len(self._events) < count:
+            self._events = np.zeros(count, dtype=self._input_dtype)
+        return self._events[:count]
+
+    def _fill_positions(self, events, points) -> None:
+        events['dx'] = np.rint((points[:, 0] - self._left) * self._x_scale)
+        events['dy'] = np.rint((points[:, 1] - self._top) * self._y_scale)
+
+    def _send(self, events) -> None:
+        if PYAUTOGUI_AVAILABLE and pg.FAILSAFE:
+            pg.failSafeCheck()  # Honour the corner failsafe once per batch
+        self._inject(events)
+
+    def _inject(self, events) -> None:
+        sent = self._send_input(len(events), events.ctypes.data, self._input_size)
+        if sent != len(events):
+            raise OSError(f"SendInput injected {sent} of {len(events)} events (blocked by a higher-privilege window?)")
+
+    def click(self, x: int, y: int) -> None:
+        """Click at (x, y)."""
+        self.click_batch(np.array([[x, y]]))
+
+    def click_batch(self, points) -> None:
+        """Click every (x, y) row of a point array: one move+down and one up event per point."""
+        events = self._buffer(2 * len(points))
+        self._fill_positions(events[0::2], points)
+        self._fill_positions(events[1::2], points)
+        events['flags'][0::2] = self._absolute | self.MOUSEEVENTF_LEFTDOWN
+        events['flags'][1::2] = self._absolute | self.MOUSEEVENTF_LEFTUP
+        self._send(events)
+
+    def move_batch(self, points) -> None:
+        """Move through every (x, y) row of a point array."""
+        events = self._buffer(len(points))
+        self._fill_positions(events, points)
+        events['flags'] = self._absolute
+        self._send(events)
+
+    def move_to(self, x: int, y: int) -> None:
+        """Move the cursor to (x, y)."""
+        self.move_batch(np.array([[x, y]]))
+
+    def mouse_down(self, x: int, y: int) -> None:
+        """Press the left button at (x, y)."""
+        events = self._buffer(1)
+        self._fill_positions(events, np.array([[x, y]]))
+        events['flags'] = self._absolute | self.MOUSEEVENTF_LEFTDOWN
+        self._send(events)
+
+    def mouse_up(self) -> None:
+        """Release the left button where the cursor is (no failsafe check, so a tripped failsafe still releases)."""
+        events = self._buffer(1)
+        events['flags'] = self.MOUSEEVENTF_LEFTUP
+        self._inject(events)
+
+
+class MockBackend:
+    """Count clicks without touching the mouse (for tests and dry runs)."""
+    name = "mock"
+    max_batch = None
+
+    def __init__(self):
+        self.clicks = 0
+        self.moves = 0
+        self.button_down = False
+        self.last_position: Optional[Tuple[int, int]] = None
+
+    def click(self, x: int, y: int) -> None:
+        """Record a click at (x, y)."""
+        self.clicks += 1
+        self.last_position = (x, y)
+
+    def click_batch(self, points) -> None:
+        """Record a click at every (x, y) row of a point array."""
+        if len(points):
+            self.clicks += len(points)
+            self.last_position = (int(points[-1, 0]), int(points[-1, 1]))
+
+    def move_batch(self, points) -> None:
+        """Record a move to every (x, y) row of a point array."""
+        if len(points):
+            self.moves += len(points)
+            self.last_position = (int(points[-1, 0]), int(points[-1, 1]))
+
+    def move_to(self, x: int, y: int) -> None:
+        """Record a move to (x, y)."""
+        self.moves += 1
+        self.last_position = (x, y)
+
+    def mouse_down(self, x: int, y: int) -> None:
+        """Record pressing the button at (x, y)."""
+        self.button_down = True
+        self.last_position = (x, y)
+
+    def mouse_up(self) -> None:
+        """Record releasing the button."""
+        self.button_down = False
+
+
+BACKENDS = {
+    "pyautogui": PyAutoGUIBackend,
+    "sendinput": SendInputBackend,
+    "mock": MockBackend,
+}
+
+
+def create_backend(name: str):
+    """Create a click backend by name."""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend: {name}")
+    return BACKENDS[name]()
+
+
+class _GdiRegionGrabber:
+    """Copy a screen region into one reused DIB section buffer (Windows GDI, no per-sample allocation)."""
+
+    def __init__(self, left: int, top: int, width: int, height: int):
+        import ctypes
+        from ctypes import wintypes
+
+        class BITMAPINFOHEADER(ctypes.Structure):
+            _fields_ = [('biSize', wintypes.DWORD), ('biWidth', wintypes.LONG), ('biHeight', wintypes.LONG),
+                        ('biPlanes', wintypes.WORD), ('biBitCount', wintypes.WORD),
+                        ('biCompression', wintypes.DWORD), ('biSizeImage', wintypes.DWORD),
+                        ('biXPelsPerMeter', wintypes.LONG), ('biYPelsPerMeter', wintypes.LONG),
+                        ('biClrUsed', wintypes.DWORD), ('biClrImportant', wintypes.DWORD)]
+
+        user32 = ctypes.windll.user32  # type: ignore[attr-defined]
+        gdi32 = ctypes.windll.gdi32  # type: ignore[attr-defined]
+        # Declare handle types explicitly so 64-bit handles are not truncated to int
+        user32.GetDC.restype = wintypes.HDC
+        user32.GetDC.argtypes = [wintypes.HWND]
+        user32.ReleaseDC.argtypes = [wintypes.HWND, wintypes.HDC]
+        gdi32.CreateCompatibleDC.restype = wintypes.HDC
+        gdi32.CreateCompatibleDC.argtypes = [wintypes.HDC]
+        gdi32.CreateDIBSection.restype = wintypes.HBITMAP
+        gdi32.CreateDIBSection.argtypes = [wintypes.HDC, ctypes.c_void_p, wintypes.UINT,
+                                           ctypes.POINTER(ctypes.c_void_p), wintypes.HANDLE, wintypes.DWORD]
+        gdi32.SelectObject.restype = wintypes.HGDIOBJ
+        gdi32.SelectObject.argtypes = [wintypes.HDC, wintypes.HGDIOBJ]
+        gdi32.BitBlt.argtypes = [wintypes.HDC, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+                                 wintypes.HDC, ctypes.c_int, ctypes.c_int, wintypes.DWORD]
+        gdi32.DeleteObject.argtypes = [wintypes.HGDIOBJ]
+        gdi32.DeleteDC.argtypes = [wintypes.HDC]
+
+        self._user32 = user32
+        self._gdi32 = gdi32
+        self.region = (left, top, width, height)
+        self._screen_dc = user32.GetDC(None)
+        self._mem_dc = gdi32.CreateCompatibleDC(self._screen_dc)
+
+        header = BITMAPINFOHEADER()
+        header.biSize = ctypes.sizeof(BITMAPINFOHEADER)
+        header.biWidth = width
+        header.biHeight = -height  # Negative height = top-down rows
+        header.biPlanes = 1
+        header.biBitCount = 32
+        header.biCompression = 0  # BI_RGB
+        bits = ctypes.c_void_p()
+        self._bitmap = gdi32.CreateDIBSection(self._mem_dc, ctypes.byref(header), 0, ctypes.byref(bits), None, 0)
+        if not self._bitmap or not bits.value:
+            self.close()
+            raise OSError("CreateDIBSection failed")
+        self._previous = gdi32.SelectObject(self._mem_dc, self._bitmap)
+
+        # View straight onto the DIB pixels; BitBlt refreshes it in place on every grab
+        self.buffer = memoryview((ctypes.c_ubyte * (width * height * 4)).from_address(bits.value)).cast('B')
+
+    def grab(self) -> memoryview:
+        """Refresh the shared buffer from the screen and return it."""
+        left, top, width, height = self.region
+        self._gdi32.BitBlt(self._mem_dc, 0, 0, width, height, self._screen_dc, left, top, 0x00CC0020)  # SRCCOPY
+        self._gdi32.GdiFlush()
+        return self.buffer
+
+    def close(self) -> None:
+        """Release the GDI objects backing the buffer."""
+        if getattr(self, '_previous', None):
+            self._gdi32.SelectObject(self._mem_dc, self._previous)
+            self._previous = None
+        if getattr(self, '_bitmap', None):
+            self._gdi32.DeleteObject(self._bitmap)
+            self._bitmap = None
+        if getattr(self, '_mem_dc', None):
+            self._gdi32.DeleteDC(self._mem_dc)
+            self._mem_dc = None
+        if getattr(self, '_screen_dc', None):
+            self._user32.ReleaseDC(None, self._screen_dc)
+            self._screen_dc = None
+
+
+class _PyAutoGUIRegionGrabber:
+    """Fallback region grabber using PyAutoGUI screenshots (portable but allocates per sample)."""
+
+    def __init__(self, left: int, top: int, width: int, height: int):
+        self.region = (left, top, width, height)
+
+    def grab(self) -> bytes:
+        """Capture the region and return its raw pixel bytes."""
+        return pg.screenshot(region=self.region).convert('RGBA').tobytes()
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+def open_region_grabber(left: int, top: int, width: int, height: int):
+    """Open the fastest available region grabber for this platform."""
+    if sys.platform == 'win32':
+        try:
+            return _GdiRegionGrabber(left, top, width, height)
+        except Exception as e:
+            if not PYAUTOGUI_AVAILABLE:
+                raise RuntimeError(f"Screen capture unavailable: GDI failed ({e}) and PyAutoGUI is not installed")
+            print(f"Warning: Fast GDI capture unavailable ({e}). Falling back to PyAutoGUI screenshots.")
+    if not PYAUTOGUI_AVAILABLE:
+        raise RuntimeError("Screen capture needs PyAutoGUI on this platform. Install with: uv add pyautogui")
+    return _PyAutoGUIRegionGrabber(left, top, width, height)
+
+
+def region_matches(sample, signature: bytes, tolerance: float) -> bool:
+    """Check a captured 4-byte-per-pixel region against its signature (mean absolute RGB difference <= tolerance)."""
+    if sample == signature:
+        return True  # Fast path: identical pixels, compared without copying
+    if tolerance <= 0 or len(sample) != len(signature):
+        return False
+    # Colour channels only: the fourth byte (alpha/padding) never changes and would dilute the mean
+    difference = sum(abs(a - b) for channel in range(3)
+                     for a, b in zip(sample[channel::4], signature[channel::4]))
+    return difference <= tolerance * (len(signature) // 4 * 3)
+
+
+class ClickVerifier:
+    """Background pixel probe that pauses or stops clicking when the target region stops matching."""
+
+    def __init__(self, region: Tuple[int, int, int, int], interval: float = 0.1,
+                 action: str = "pause", tolerance: float = 12.0):
+        if action not in ("pause", "stop"):
+            raise ValueError(f"Unknown verification action: {action}")
+        if action == "pause" and not KEYBOARD_AVAILABLE:
+            # Without the pause hotkey nothing could ever resume the run
+            print("Warning: 'keyboard' module not available, so a verification pause could never be resumed. "
+                  "Stopping on mismatch instead.")
+            action = "stop"
+        self.region = region
+        self.interval = interval
+        self.action = action
+        self.tolerance = tolerance
+        self.samples = 0
+        self.mismatches = 0
+        self._grabber = None
+        self._signature = b""
+        self._wake = threading.Event()
+        self._done = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Capture the expected signature and start sampling in a background thread."""
+        self._grabber = open_region_grabber(*self.region)
+        try:
+            self._signature = bytes(self._grabber.grab())
+        except Exception:
+            self._grabber.close()
+            self._grabber = None
+            raise
+        self._done.clear()
+        self._thread = threading.Thread(target=self._run, name="click-verifier", daemon=True)
+        self._thread.start()
+
+    def request_sample(self) -> None:
+        """Ask the background thread to take a sample now (used for every-N-clicks checks)."""
+        self._wake.set()
+
+    def stop(self) -> None:
+        """Stop sampling; the sampling thread releases the capture buffer once its last grab is done."""
+        self._done.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def _run(self) -> None:
+        try:
+            self._sample_until_done()
+        finally:
+            # Closing here (not in stop()) means a slow grab never sees its buffer freed underneath it
+            if self._grabber is not None:
+                self._grabber.close()
+                self._grabber = None
+
+    def _sample_until_done(self) -> None:
+        interval = self.interval if self.interval > 0 else None  # None = only sample on request
+        while not self._done.is_set():
+            self._wake.wait(interval)
+            self._wake.clear()
+            if self._done.is_set():
+                break
+            if is_paused or emergency_stop:
+                continue  # Nothing to protect while the engine is idle
+
+            self.samples += 1
+            try:
+                sample = self._grabber.grab()  # type: ignore[union-attr]
+            except Exception as e:
+                print(f"\nWarning: Verification capture failed: {e}")
+                continue
+            if not region_matches(sample, self._signature, self.tolerance):
+                self.mismatches += 1
+                self._trigger()
+
+    def _trigger(self) -> None:
+        global emergency_stop, emergency_stop_reason, is_paused, pause_reason
+        reason = f"Verification region {self.region} no longer matches"
+        if self.action == "stop":
+            emergency_stop = True
+            emergency_stop_reason = reason
+            print(f"\n🚨 VERIFICATION FAILED! {reason}. Stopping.")
+        else:
+            is_paused = True
+            pause_reason = reason
+            print(f"\n⏸️  VERIFICATION FAILED! {reason}. Paused - fix the screen and press the pause hotkey to resume.")
+
+
+def parse_region(value: str) -> Tuple[int, int, int, int]:
+    """Parse a 'left,top,width,height' region string."""
+    try:
+        left, top, width, height = (int(part) for part in value.split(','))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Region must be 'left,top,width,height', got '{value}'")
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError(f"Region width and height must be positive, got '{value}'")
+    return (left, top, width, height)
+
+
+def compact_points(xs, ys):
+    """Round coordinates into a compact (N, 2) int16 array (int32 if they do not fit), dropping repeats."""
+    points = np.column_stack((np.rint(xs), np.rint(ys)))
+    if len(points) > 1:
+        keep = np.ones(len(points), dtype=bool)
+        keep[1:] = np.any(points[1:] != points[:-1], axis=1)
+        points = points[keep]
+    int16 = np.iinfo(np.int16)
+    fits_int16 = points.size == 0 or (points.min() >= int16.min and points.max() <= int16.max)
+    return np.ascontiguousarray(points, dtype=np.int16 if fits_int16 else np.int32)
+
+
+def line_path(start: Tuple[int, int], end: Tuple[int, int], step: float = 1.0):
+    """Points along a straight line, roughly step pixels apart."""
+    length = math.hypot(end[0] - start[0], end[1] - start[1])
+    t = np.linspace(0.0, 1.0, max(2, math.ceil(length / step) + 1))
+    return compact_points(start[0] + (end[0] - start[0]) * t, start[1] + (end[1] - start[1]) * t)
+
+
+def grid_path(region: Tuple[int, int, int, int], step: float = 10.0):
+    """Points covering a region row by row (alternating direction so drags never jump back)."""
+    left, top, width, height = region
+    xs = np.arange(left, left + width, step)
+    ys = np.arange(top, top + height, step)
+    grid_x = np.tile(xs, (len(ys), 1))
+    grid_x[1::2] = grid_x[1::2, ::-1]
+    return compact_points(grid_x.ravel(), np.repeat(ys, len(xs)))
+
+
+def bezier_path(control_points: List[Tuple[int, int]], step: float = 1.0):
+    """Points along a Bezier curve of any degree, at most roughly step pixels apart."""
+    controls = np.asarray(control_points, dtype=np.float64)
+    degree = len(controls) - 1
+    polygon_length = np.hypot(*np.diff(controls, axis=0).T).sum()  # Upper bound on the curve length
+    t = np.linspace(0.0, 1.0, max(2, math.ceil(polygon_length / step) + 1))[:, None]
+    k = np.arange(degree + 1)
+    binomials = np.array([math.comb(degree, i) for i in k], dtype=np.float64)
+    curve = (binomials * t ** k * (1.0 - t) ** (degree - k)) @ controls  # Bernstein form, all points at once
+    return compact_points(curve[:, 0], curve[:, 1])
+
+
+def spiral_path(center: Tuple[int, int], radius: float, turns: float = 5.0, step: float = 1.0):
+    """Points along an Archimedean spiral growing out from center, roughly step pixels apart."""
+    theta_max = 2 * math.pi * turns
+    growth = radius / theta_max  # r = growth * theta
+    length = growth * theta_max ** 2 / 2  # Arc length approximation for r = b*theta
+    # Arc length grows with theta^2, so sqrt-spaced angles give evenly spaced points
+    theta = np.sqrt(np.linspace(0.0, 1.0, max(2, math.ceil(length / step) + 1))) * theta_max
+    r = growth * theta
+    return compact_points(center[0] + r * np.cos(theta), center[1] + r * np.sin(theta))
+
+
+def parse_point(value: str) -> Tuple[int, int]:
+    """Parse an 'x,y' point string."""
+    try:
+        x, y = (int(part) for part in value.split(','))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Point must be 'x,y', got '{value}'")
+    return (x, y)
+
+
+def build_path(args: argparse.Namespace, start: Tuple[int, int]):
+    """Precompute the motion path requested on the command line."""
+    if args.path == 'line':
+        return line_path(start, args.to, args.step)
+    if args.path == 'bezier':
+        return bezier_path([start] + (args.control or []) + [args.to], args.step)
+    if args.path == 'spiral':
+        return spiral_path(start, args.radius, args.turns, args.step)
+    if args.path == 'grid':
+        return grid_path(args.path_region, args.step)
+    raise ValueError(f"Unknown path: {args.path}")
+
+
 def parse_arguments() -> argparse.Namespace:
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -106,6 +630,24 @@ Examples:
   
   # Pause every 30 seconds during time-based clicking
   uv run --with pyautogui  --with keyboard  turbo_clicker.py --duration=300 --pause-interval=30
+
+  # Pause if the 5x5 pixels around the target change (checked every 100ms and every 500 clicks)
+  uv run --with pyautogui  --with keyboard  turbo_clicker.py --x=400 --y=300 --verify --verify-every=500
+
+  # Multi-host: start an agent on each desktop...
+  uv run --with pyautogui  --with keyboard  turbo_clicker.py --agent --listen=0.0.0.0:47800
+
+  # ...then run the same job on all of them, started together, with one combined report
+  uv run --with pyautogui  --with keyboard  turbo_clicker.py --coordinator=10.0.0.5,10.0.0.6:47800 --x=400 --y=300 --duration=60 --rate=200
+
+  # Click a grid every 10 pixels over a 800x600 region (paths need NumPy)
+  uv run --with pyautogui  --with keyboard  --with numpy turbo_clicker.py --path=grid --path-region=100,100,800,600 --step=10
+
+  # Drag along a line, sweeping back and forth for 60 seconds with raw Windows SendInput batches
+  uv run --with pyautogui  --with keyboard  --with numpy turbo_clicker.py --path=line --x=100 --y=500 --to=900,500 --path-mode=drag --duration=60 --backend=sendinput
+
+  # Move through a 10-turn spiral around (640, 360)
+  uv run --with pyautogui  --with keyboard  --with numpy turbo_clicker.py --path=spiral --x=640 --y=360 --radius=300 --turns=10 --path-mode=move
         """)
     
     parser.add_argument('--clicks', '-c', type=int, 
@@ -114,8 +656,11 @@ Examples:
                        help='Duration in seconds to click (conflicts with --clicks)')
     parser.add_argument('--x', type=int, help='X coordinate to click (if not provided, uses current mouse position)')
     parser.add_argument('--y', type=int, help='Y coordinate to click (if not provided, uses current mouse position)')
-    parser.add_argument('--delay', '-d', type=float, default=0.0,
+    speed_group = parser.add_mutually_exclusive_group()
+    speed_group.add_argument('--delay', '-d', type=float, default=0.0,
                        help='Delay between clicks in seconds (default: 0.0 for maximum speed)')
+    speed_group.add_argument('--rate', type=float,
+                       help='Approximate clicks per second (sets the delay to 1/RATE; conflicts with --delay)')
     parser.add_argument('--turbo-mode', '--turbo', action='store_true',
                        help='Enable maximum speed mode (disables all PyAutoGUI safety delays)')
     parser.add_argument('--verbose', '-v', action='store_true',
@@ -130,6 +675,49 @@ Examples:
                        help='Pause/Resume toggle hotkey (default: f9)')
     parser.add_argument('--pause-interval', type=int, default=0,
                        help='Pause every N clicks/seconds to ask "Continue to iterate?" (0 = no pauses)')
+    parser.add_argument('--verify', action='store_true',
+                       help='Sample pixels around the target in the background and react if they change '
+                            '(cheap on Windows; elsewhere every sample is a full PyAutoGUI screenshot)')
+    parser.add_argument('--verify-region', type=parse_region, metavar='LEFT,TOP,WIDTH,HEIGHT',
+                       help='Screen region to verify (default: 5x5 pixels centred on the target; '
+                            'required with --path, and must lie outside the sweep)')
+    parser.add_argument('--verify-interval', type=float, default=0.1,
+                       help='Seconds between verification samples (default: 0.1; 0 = only use --verify-every)')
+    parser.add_argument('--verify-every', type=int, default=0,
+                       help='Also take a verification sample every N clicks (0 = disabled)')
+    parser.add_argument('--verify-action', choices=['pause', 'stop'], default='pause',
+                       help='What to do when the region stops matching (default: pause)')
+    parser.add_argument('--verify-tolerance', type=float, default=12.0,
+                       help='Allowed mean per-channel difference from the initial capture (default: 12)')
+    parser.add_argument('--backend', choices=sorted(BACKENDS),
+                       help='Click backend (default: pyautogui; mock only counts clicks, for testing)')
+    parser.add_argument('--agent', action='store_true',
+                       help='Run as an agent that executes jobs sent by a --coordinator')
+    parser.add_argument('--listen', type=lambda value: parse_address(value, "127.0.0.1"),
+                       default=('127.0.0.1', AGENT_DEFAULT_PORT), metavar='HOST:PORT',
+                       help=f'Agent listen address (default: 127.0.0.1:{AGENT_DEFAULT_PORT}; use 0.0.0.0 for remote coordinators)')
+    parser.add_argument('--once', action='store_true',
+                       help='Agent exits after serving one coordinator session')
+    parser.add_argument('--coordinator', type=parse_agent_list, metavar='HOST:PORT,...',
+                       help='Run this job on the listed agents with a synchronized start and combined report')
+    parser.add_argument('--start-delay', type=float, default=3.0,
+                       help='Seconds between dispatching a coordinated job and its synchronized start (default: 3)')
+    parser.add_argument('--path', choices=['line', 'grid', 'bezier', 'spiral'],
+                       help='Sweep a precomputed path instead of clicking in place (starts at --x/--y; needs NumPy)')
+    parser.add_argument('--path-mode', choices=['click', 'move', 'drag'], default='click',
+                       help='Click each path point, just move through them, or drag along them (default: click)')
+    parser.add_argument('--to', type=parse_point, metavar='X,Y',
+                       help='End point for line and bezier paths')
+    parser.add_argument('--control', type=parse_point, action='append', metavar='X,Y',
+                       help='Bezier control point (repeat for higher-degree curves)')
+    parser.add_argument('--path-region', type=parse_region, metavar='LEFT,TOP,WIDTH,HEIGHT',
+                       help='Region covered by grid paths')
+    parser.add_argument('--radius', type=float, help='Outer radius of spiral paths in pixels')
+    parser.add_argument('--turns', type=float, default=5.0, help='Number of turns in spiral paths (default: 5)')
+    parser.add_argument('--step', type=float, default=5.0,
+                       help='Spacing between path points in pixels (default: 5)')
+    parser.add_argument('--batch-size', type=int, default=1000,
+                       help='Path points sent to the backend per batch (default: 1000)')
     
     args = parser.parse_args()
     
@@ -137,8 +725,55 @@ Examples:
     if args.clicks is not None and args.duration is not None:
         parser.error("--clicks and --duration are mutually exclusive. Use one or the other.")
     
-    if args.clicks is None and args.duration is None:
-        args.clicks = 1000000  # Default to 1 million clicks
+    if args.clicks is None and args.duration is None and not args.path:
+        args.clicks = 1000000  # Default to 1 million clicks (paths default to one sweep)
+    
+    if args.rate is not None:
+        if args.rate <= 0:
+            parser.error("--rate must be positive.")
+        args.delay = 1.0 / args.rate
+    
+    if args.agent and args.coordinator:
+        parser.error("--agent and --coordinator are mutually exclusive.")
+    
+    if args.coordinator and (args.x is None or args.y is None):
+        parser.error("--coordinator requires --x and --y (agents cannot pick a position interactively).")
+    
+    if args.coordinator:
+        # Agents choose their own backend and cannot answer interactive prompts
+        if args.backend is not None:
+            parser.error("--backend is chosen by each agent; pass it to --agent instead of --coordinator.")
+        if args.pause_interval > 0:
+            parser.error("--pause-interval is not supported with --coordinator (agents cannot prompt).")
+    args.backend = args.backend or 'pyautogui'
+    
+    if args.backend == 'mock' and not args.agent and args.path != 'grid' and (args.x is None or args.y is None):
+        parser.error("--backend=mock requires --x and --y.")
+    
+    if args.path:
+        if not NUMPY_AVAILABLE:
+            parser.error("--path needs NumPy. Run with: uv run --with numpy ... (or uv add numpy)")
+        if args.coordinator:
+            parser.error("--path is not supported with --coordinator.")
+        if args.path in ('line', 'bezier') and args.to is None:
+            parser.error(f"--path={args.path} requires --to.")
+        if args.path == 'grid' and args.path_region is None:
+            parser.error("--path=grid requires --path-region.")
+        if args.path == 'spiral' and (args.radius is None or args.radius <= 0 or args.turns <= 0):
+            parser.error("--path=spiral requires a positive --radius and --turns.")
+        if args.verify and args.verify_region is None:
+            parser.error("--verify with --path needs --verify-region outside the sweep "
+                         "(the default region around the start point changes as the path is swept).")
+        if args.control and args.path != 'bezier':
+            parser.error("--control only applies to --path=bezier.")
+        if args.step <= 0 or args.batch_size <= 0:
+            parser.error("--step and --batch-size must be positive.")
+    
+    if args.verify and args.verify_interval <= 0 and args.verify_every <= 0:
+        parser.error("--verify needs --verify-interval > 0 or --verify-every > 0.")
+    
+    if args.verify and not args.coordinator and sys.platform != 'win32' and not PYAUTOGUI_AVAILABLE:
+        parser.error("--verify needs PyAutoGUI for screen capture on this platform. Install with: uv add pyautogui")
     
     return args
 
@@ -202,10 +837,34 @@ def ask_continue(context: str) -> bool:
             print("Please enter 'y' for yes or 'n' for no.")
 
 
+def wait_until(timestamp: float) -> None:
+    """Block until the wall-clock time reaches timestamp (returns early on emergency stop)."""
+    while not emergency_stop:
+        remaining = timestamp - time.time()
+        if remaining <= 0:
+            return
+        # Sleep coarsely, then spin for the last few milliseconds for an accurate start
+        time.sleep(min(remaining - 0.005, 0.1) if remaining > 0.005 else 0)
+
+
+def responsive_sleep(seconds: float) -> None:
+    """Sleep in short slices, returning early on emergency stop or pause."""
+    end = time.perf_counter() + seconds
+    while not emergency_stop and not is_paused:
+        remaining = end - time.perf_counter()
+        if remaining <= 0:
+            return
+        time.sleep(min(remaining, 0.05))
+
+
 def turbo_click(x: int, y: int, clicks: Optional[int] = None, duration: Optional[float] = None, 
                 delay: float = 0.0, verbose: bool = False, emergency_hotkey: str = "f12",
-                pause_hotkey: str = "f9", pause_interval: int = 0) -> None:
-    """Perform ultra-fast clicking at the specified coordinates."""
+                pause_hotkey: str = "f9", pause_interval: int = 0,
+                verifier: Optional[ClickVerifier] = None, verify_every: int = 0,
+                backend=None, progress_callback: Optional[Callable[[int, float], None]] = None,
+                start_at: Optional[float] = None, path=None, path_mode: str = "click",
+                batch_size: int = 1000) -> Dict[str, Any]:
+    """Perform ultra-fast clicking at the specified coordinates (or along a precomputed path) and return the run statistics."""
     global emergency_stop, emergency_stop_reason, is_paused, pause_reason
     
     # Reset emergency stop and pause state
@@ -219,36 +878,156 @@ def turbo_click(x: int, y: int, clicks: Optional[int] = None, duration: Optional
     
     # Determine operation mode
     time_based = duration is not None
+    if path is not None:
+        if path_mode not in ("click", "move", "drag"):
+            raise ValueError(f"Unknown path mode: {path_mode}")
+        if len(path) == 0:
+            raise ValueError("Path has no points")
+        x, y = int(path[0, 0]), int(path[0, 1])
+        target = f"{duration} seconds" if time_based else f"{clicks:,} points"
+        print(f"Starting {path_mode} path: {target} along a {len(path):,}-point {path.dtype} path from ({x}, {y})")
     if time_based:
-        print(f"Starting time-based clicking: {duration} seconds at ({x}, {y})")
-        target_end_time = time.perf_counter() + duration
+        if path is None:
+            print(f"Starting time-based clicking: {duration} seconds at ({x}, {y})")
         clicks_performed = 0
         total_target = "∞"
     else:
-        print(f"Starting count-based clicking: {clicks:,} clicks at ({x}, {y})")
+        if path is None:
+            print(f"Starting count-based clicking: {clicks:,} clicks at ({x}, {y})")
         clicks_performed = 0
         total_target = clicks
         target_end_time = 0.0  # Not used in count-based mode
         if clicks is None:
             raise ValueError("Either clicks or duration must be specified")
     
+    if backend is None:
+        backend = PyAutoGUIBackend()
+    click = backend.click  # Local lookup keeps the hot loops lean
+    
+    if path is not None:
+        # Stop, pause and the verifier are honoured between batches, so keep each batch to ~50ms
+        if backend.max_batch:
+            batch_size = min(batch_size, backend.max_batch)
+        if delay > 0:
+            batch_size = min(batch_size, max(1, int(0.05 / delay)))
+        print(f"Batch size: {batch_size:,} points")
+    
     print(f"Delay between clicks: {delay}s")
     print(f"Emergency stop: {emergency_hotkey.upper()}")
     print(f"Pause/Resume toggle: {pause_hotkey.upper()}")
     if pause_interval > 0:
         interval_desc = f"every {pause_interval} seconds" if time_based else f"every {pause_interval:,} clicks"
         print(f"Pause prompts: {interval_desc}")
+    if verifier is not None:
+        checks = [f"every {verifier.interval}s"] if verifier.interval > 0 else []
+        if verify_every > 0:
+            checks.append(f"every {verify_every:,} clicks")
+        print(f"Verifying region {verifier.region} {' and '.join(checks)} (on mismatch: {verifier.action})")
+    else:
+        verify_every = 0  # Nothing to notify
     
     if verbose:
         print("Starting in 3 seconds... Move mouse to top-left corner to abort if needed.")
         time.sleep(3)
     
+    # Synchronized start (coordinator mode): wait for the agreed wall-clock time
+    if start_at is not None:
+        print(f"Waiting {max(0.0, start_at - time.time()):.2f}s for synchronized start...")
+        wait_until(start_at)
+    
     start_time = time.perf_counter()
+    if time_based:
+        target_end_time = start_time + duration
     last_progress_update = start_time
     last_pause_check = 0  # Track when we last checked for pause
+    report_progress = verbose or progress_callback is not None
+    button_down = False  # Drag paths hold the button between batches
     
     try:
-        if time_based:
+        # Capture the expected signature right before the first click, with the cursor already
+        # on the target so hover styling is part of the signature rather than a mismatch
+        if verifier is not None:
+            backend.move_to(x, y)
+            time.sleep(0.1)  # Let the target repaint its hover state
+            verifier.start()
+            start_time = time.perf_counter()
+            if time_based:
+                target_end_time = start_time + duration
+            last_progress_update = start_time
+        
+        if path is not None:
+            # Path streaming loop: whole batches of precomputed points go to the backend at once,
+            # repeating the sweep until the target count or duration is reached
+            send_batch = backend.click_batch if path_mode == "click" else backend.move_batch
+            path_length = len(path)
+            position = 0
+            last_pause_prompt = 0
+            while not emergency_stop:
+                # Check if paused - release any drag and wait until unpaused
+                if is_paused:
+                    if button_down:
+                        backend.mouse_up()
+                        button_down = False
+                    while is_paused and not emergency_stop:
+                        time.sleep(0.1)  # Small sleep to prevent busy waiting
+                    if emergency_stop:
+                        break
+                
+                if time_based:
+                    if time.perf_counter() >= target_end_time:
+                        break
+                    count = batch_size
+                else:
+                    count = min(batch_size, clicks - clicks_performed)
+                    if count <= 0:
+                        break
+                count = min(count, path_length - position)
+                batch = path[position:position + count]  # A view: no copy per batch
+                
+                if path_mode == "drag" and not button_down:
+                    backend.mouse_down(int(batch[0, 0]), int(batch[0, 1]))
+                    button_down = True
+                send_batch(batch)
+                previous = clicks_performed
+                clicks_performed += count
+                position += count
+                if position == path_length:
+                    position = 0
+                    if button_down:
+                        backend.mouse_up()  # Each sweep is its own drag
+                        button_down = False
+                
+                if verify_every > 0 and clicks_performed // verify_every > previous // verify_every:
+                    verifier.request_sample()  # type: ignore[union-attr]
+                
+                # Check for pause prompt (batches step over exact multiples, so look for crossings)
+                elapsed = time.perf_counter() - start_time
+                if pause_interval > 0:
+                    mark = int(elapsed) if time_based else clicks_performed
+                    if mark // pause_interval > last_pause_prompt:
+                        last_pause_prompt = mark // pause_interval
+                        if button_down:
+                            backend.mouse_up()
+                            button_down = False
+                        context = f"after {elapsed:.0f} seconds" if time_based else f"after {clicks_performed:,} points"
+                        if not ask_continue(context):
+                            break
+                
+                # Progress updates for verbose mode and progress listeners
+                if report_progress and time.perf_counter() - last_progress_update >= 1.0:
+                    if verbose:
+                        rate = clicks_performed / elapsed if elapsed > 0 else 0
+                        done = (f"{clicks_performed:,} points" if time_based else
+                                f"{clicks_performed:,}/{clicks:,} points ({clicks_performed/clicks*100:.1f}%)")
+                        print(f"\rProgress: {done} in {elapsed:.1f}s | Speed: {rate:.1f} points/sec", end="", flush=True)
+                    if progress_callback is not None:
+                        progress_callback(clicks_performed, elapsed)
+                    last_progress_update = time.perf_counter()
+                
+                # Optional delay, applied per batch at the same average rate as a per-click delay
+                if delay > 0:
+                    responsive_sleep(delay * count)
+        elif time_based:
             # Time-based clicking loop
             while time.perf_counter() < target_end_time:
                 if emergency_stop:
@@ -264,8 +1043,10 @@ def turbo_click(x: int, y: int, clicks: Optional[int] = None, duration: Optional
                 # Only click if we're not paused (double check to prevent race conditions)
                 if not is_paused:
                     # Perform the click
-                    pg.click(x, y)
+                    click(x, y)
                     clicks_performed += 1
+                    if verify_every > 0 and clicks_performed % verify_every == 0:
+                        verifier.request_sample()  # type: ignore[union-attr]
                 
                 # Check for pause prompt
                 elapsed = time.perf_counter() - start_time
@@ -274,12 +1055,15 @@ def turbo_click(x: int, y: int, clicks: Optional[int] = None, duration: Optional
                         break
                     last_pause_check = int(elapsed)
                 
-                # Progress updates for verbose mode
-                if verbose and time.perf_counter() - last_progress_update >= 1.0:
-                    cps = clicks_performed / elapsed if elapsed > 0 else 0
-                    remaining_time = target_end_time - time.perf_counter()
-                    print(f"\rProgress: {clicks_performed:,} clicks in {elapsed:.1f}s | "
-                          f"Speed: {cps:.1f} clicks/sec | Time remaining: {remaining_time:.1f}s", end="", flush=True)
+                # Progress updates for verbose mode and progress listeners
+                if report_progress and time.perf_counter() - last_progress_update >= 1.0:
+                    if verbose:
+                        cps = clicks_performed / elapsed if elapsed > 0 else 0
+                        remaining_time = target_end_time - time.perf_counter()
+                        print(f"\rProgress: {clicks_performed:,} clicks in {elapsed:.1f}s | "
+                              f"Speed: {cps:.1f} clicks/sec | Time remaining: {remaining_time:.1f}s", end="", flush=True)
+                    if progress_callback is not None:
+                        progress_callback(clicks_performed, elapsed)
                     last_progress_update = time.perf_counter()
                 
                 # Optional delay between clicks
@@ -302,8 +1086,10 @@ def turbo_click(x: int, y: int, clicks: Optional[int] = None, duration: Optional
                 # Only click if we're not paused (double check to prevent race conditions)
                 if not is_paused:
                     # Perform the click
-                    pg.click(x, y)
+                    click(x, y)
                     clicks_performed += 1
+                    if verify_every > 0 and clicks_performed % verify_every == 0:
+                        verifier.request_sample()  # type: ignore[union-attr]
                 
                 # Check for pause prompt
                 if pause_interval > 0 and clicks_performed % pause_interval == 0:
@@ -311,14 +1097,17 @@ def turbo_click(x: int, y: int, clicks: Optional[int] = None, duration: Optional
                     if not check_continue_prompt(pause_interval, clicks_performed, elapsed, time_based):
                         break
                 
-                # Progress updates for verbose mode
-                if verbose and time.perf_counter() - last_progress_update >= 1.0:
+                # Progress updates for verbose mode and progress listeners
+                if report_progress and time.perf_counter() - last_progress_update >= 1.0:
                     elapsed = time.perf_counter() - start_time
-                    cps = clicks_performed / elapsed if elapsed > 0 else 0
-                    remaining = clicks - clicks_performed
-                    eta = remaining / cps if cps > 0 else 0
-                    print(f"\rProgress: {clicks_performed:,}/{clicks:,} clicks ({clicks_performed/clicks*100:.1f}%) | "
-                          f"Speed: {cps:.1f} clicks/sec | ETA: {eta:.1f}s", end="", flush=True)
+                    if verbose:
+                        cps = clicks_performed / elapsed if elapsed > 0 else 0
+                        remaining = clicks - clicks_performed
+                        eta = remaining / cps if cps > 0 else 0
+                        print(f"\rProgress: {clicks_performed:,}/{clicks:,} clicks ({clicks_performed/clicks*100:.1f}%) | "
+                              f"Speed: {cps:.1f} clicks/sec | ETA: {eta:.1f}s", end="", flush=True)
+                    if progress_callback is not None:
+                        progress_callback(clicks_performed, elapsed)
                     last_progress_update = time.perf_counter()
                 
                 # Optional delay between clicks
@@ -327,11 +1116,19 @@ def turbo_click(x: int, y: int, clicks: Optional[int] = None, duration: Optional
                     
     except KeyboardInterrupt:
         print(f"\n\nInterrupted by user (Ctrl+C) after {clicks_performed:,} clicks")
-    except pg.FailSafeException:
+    except FAILSAFE_EXCEPTIONS:
         print(f"\n\nFailSafe triggered after {clicks_performed:,} clicks")
     finally:
-        # Cleanup hotkeys
+        # Never leave the button held after a drag
+        if button_down:
+            try:
+                backend.mouse_up()
+            except Exception as e:
+                print(f"\nWarning: Could not release mouse button: {e}")
+        # Cleanup hotkeys and stop the verifier
         cleanup_hotkeys()
+        if verifier is not None:
+            verifier.stop()
     
     # Handle emergency stop
     if emergency_stop:
@@ -351,48 +1148,504 @@ def turbo_click(x: int, y: int, clicks: Optional[int] = None, duration: Optional
     print(f"Total clicks performed: {clicks_performed:,}")
     print(f"Total time: {total_time:.2f} seconds")
     print(f"Average speed: {clicks_performed / total_time:.1f} clicks per second")
+    if verifier is not None:
+        print(f"Verification: {verifier.samples:,} samples, {verifier.mismatches:,} mismatches")
     
     if time_based:
-        if total_time >= duration * 0.95:  # Within 5% of target
+        completed = total_time >= duration * 0.95  # Within 5% of target
+        if completed:
             print("✅ Time duration completed successfully!")
         else:
             print(f"⚠️  Stopped early. Ran for {total_time/duration*100:.1f}% of target duration.")
     else:
         assert clicks is not None  # This should never be None here
-        if clicks_performed >= clicks:
+        completed = clicks_performed >= clicks
+        if completed:
             print("✅ All clicks completed successfully!")
         else:
             print(f"⚠️  Stopped early. Completed {clicks_performed/clicks*100:.1f}% of target clicks.")
+    
+    return {
+        "clicks": clicks_performed,
+        "elapsed": total_time,
+        "cps": clicks_performed / total_time if total_time > 0 else 0.0,
+        "completed": completed,
+        "stop_reason": emergency_stop_reason if emergency_stop else "",
+    }
+
+
+def parse_address(value: str, default_host: str = "127.0.0.1") -> Tuple[str, int]:
+    """Parse a 'host:port', 'host' or ':port' address."""
+    host, _, port = value.rpartition(':') if ':' in value else (value, '', '')
+    try:
+        return (host or default_host, int(port) if port else AGENT_DEFAULT_PORT)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Address must be 'host:port', got '{value}'")
+
+
+def parse_agent_list(value: str) -> List[Tuple[str, int]]:
+    """Parse a comma-separated list of agent addresses."""
+    agents = [parse_address(part.strip()) for part in value.split(',') if part.strip()]
+    if not agents:
+        raise argparse.ArgumentTypeError("At least one agent address is required")
+    return agents
+
+
+class MessageChannel:
+    """Newline-delimited JSON messages over a TCP socket (sends are thread-safe)."""
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self._reader = sock.makefile('r', encoding='utf-8')
+        self._send_lock = threading.Lock()
+
+    def send(self, **message: Any) -> None:
+        """Send one message."""
+        data = (json.dumps(message) + '\n').encode('utf-8')
+        with self._send_lock:
+            self.sock.sendall(data)
+
+    def receive(self) -> Optional[Dict[str, Any]]:
+        """Receive one message, or None once the peer has gone away."""
+        try:
+            line = self._reader.readline()
+            return json.loads(line) if line else None
+        except (OSError, ValueError):
+            return None
+
+    def close(self) -> None:
+        """Close the connection."""
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._reader.close()
+        self.sock.close()
+
+
+def run_agent_job(channel: MessageChannel, job: Dict[str, Any], start_at: float, backend_name: str) -> None:
+    """Run one coordinator job locally, streaming progress and the final statistics back."""
+    def report(clicks: int, elapsed: float) -> None:
+        try:
+            channel.send(type="progress", clicks=clicks, elapsed=elapsed)
+        except OSError:
+            pass  # Coordinator gone; the reader loop stops the job
+
+    try:
+        backend = create_backend(backend_name)
+        if backend_name == "pyautogui":
+            configure_pyautogui(job.get("turbo_mode", False), job.get("failsafe", True))
+        # Each agent verifies its own screen with the coordinator's settings
+        verify = job.get("verify") or {}
+        verifier = None
+        if verify:
+            region = tuple(verify["region"]) if verify.get("region") else (job["x"] - 2, job["y"] - 2, 5, 5)
+            verifier = ClickVerifier(region, verify.get("interval", 0.1), verify.get("action", "pause"),
+                                     verify.get("tolerance", 12.0))
+        stats = turbo_click(job["x"], job["y"], job.get("clicks"), job.get("duration"), job.get("delay", 0.0),
+                            verifier=verifier, verify_every=verify.get("every", 0),
+                            backend=backend, progress_callback=report, start_at=start_at)
+        channel.send(type="result", stats=stats)
+    except Exception as e:
+        try:
+            channel.send(type="error", message=str(e))
+        except OSError:
+            pass
+
+
+def serve_coordinator(channel: MessageChannel, backend_name: str) -> None:
+    """Handle one coordinator connection: jobs, clock pings and pause/resume/stop broadcasts."""
+    global emergency_stop, emergency_stop_reason, is_paused, pause_reason
+    worker: Optional[threading.Thread] = None
+
+    try:
+        while True:
+            message = channel.receive()
+            if message is None:
+                break
+            if not isinstance(message, dict):
+                channel.send(type="error", message="Messages must be JSON objects")
+                continue
+            kind = message.get("type")
+            if kind == "ping":
+                channel.send(type="pong", time=time.time())
+            elif kind == "job":
+                job = message.get("job")
+                start_at = message.get("start_at")
+                if (not isinstance(job, dict) or not isinstance(start_at, (int, float))
+                        or not isinstance(job.get("x"), int) or not isinstance(job.get("y"), int)):
+                    channel.send(type="error", message="Job needs 'job' with integer 'x'/'y' and a numeric 'start_at'")
+                    continue
+                if worker is not None and worker.is_alive():
+                    channel.send(type="error", message="Agent is already running a job")
+                    continue
+                worker = threading.Thread(target=run_agent_job, name="agent-job", daemon=True,
+                                          args=(channel, job, start_at, backend_name))
+                worker.start()
+            elif kind == "pause":
+                is_paused = True
+                pause_reason = "Paused by coordinator"
+                print("\n⏸️  PAUSED by coordinator.")
+            elif kind == "resume":
+                is_paused = False
+                print("\n▶️  RESUMED by coordinator. Continuing...")
+            elif kind == "stop":
+                emergency_stop = True
+                emergency_stop_reason = "Stopped by coordinator"
+            else:
+                channel.send(type="error", message=f"Unknown message type: {kind}")
+    finally:
+        # Never keep clicking for a coordinator that is no longer listening
+        if worker is not None and worker.is_alive():
+            emergency_stop = True
+            emergency_stop_reason = "Coordinator disconnected"
+            worker.join()
+        channel.close()
+
+
+def run_agent(host: str, port: int, backend_name: str = "pyautogui", once: bool = False) -> None:
+    """Listen for coordinators and run the click jobs they dispatch."""
+    create_backend(backend_name)  # Fail fast if the backend cannot work on this machine
+    server = socket.create_server((host, port))
+    print(f"🛰️  Agent listening on {host}:{port} (backend: {backend_name}). Ctrl+C to quit.")
+    try:
+        while True:
+            conn, address = server.accept()
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            print(f"Coordinator connected from {address[0]}:{address[1]}")
+            try:
+                serve_coordinator(MessageChannel(conn), backend_name)
+            except (OSError, ValueError) as e:
+                print(f"Warning: Coordinator connection failed: {e}")
+            print("Coordinator disconnected.")
+            if once:
+                break
+    except KeyboardInterrupt:
+        print("\nAgent stopped by user (Ctrl+C)")
+    finally:
+        server.close()
+
+
+class AgentLink:
+    """Coordinator-side connection to one agent."""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.name = f"{host}:{port}"
+        self.channel: Optional[MessageChannel] = None
+        self.clock_offset = 0.0  # agent clock - coordinator clock
+        self.clicks = 0
+        self.elapsed = 0.0
+        self.stats: Optional[Dict[str, Any]] = None
+        self.error = ""
+
+    @property
+    def finished(self) -> bool:
+        """Whether the agent has reported a result or failed."""
+        return self.stats is not None or bool(self.error)
+
+
+class Coordinator:
+    """Dispatch one click job to several agents, start them together and aggregate their results."""
+
+    def __init__(self, agents: List[Tuple[str, int]], connect_timeout: float = 10.0):
+        self.agents = [AgentLink(host, port) for host, port in agents]
+        self.connect_timeout = connect_timeout
+        self._readers: List[threading.Thread] = []
+
+    def connect(self) -> None:
+        """Connect to every agent and estimate its clock offset."""
+        for agent in self.agents:
+            deadline = time.time() + self.connect_timeout
+            while True:
+                try:
+                    sock = socket.create_connection((agent.host, agent.port), timeout=self.connect_timeout)
+                    break
+                except OSError:
+                    if time.time() >= deadline:
+                        raise ConnectionError(f"Could not connect to agent {agent.name}")
+                    time.sleep(0.2)  # Agent may still be starting up
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            agent.channel = MessageChannel(sock)
+            # Keep the timeout through the handshake so a silent listener cannot hang us
+            agent.clock_offset = self._measure_clock_offset(agent.channel)
+            sock.settimeout(None)
+
+    @staticmethod
+    def _measure_clock_offset(channel: MessageChannel, samples: int = 5) -> float:
+        """Estimate the agent's clock offset from the lowest-latency ping (NTP-style midpoint)."""
+        best_rtt, best_offset = float("inf"), 0.0
+        for _ in range(samples):
+            sent = time.time()
+            channel.send(type="ping")
+            reply = channel.receive()
+            received = time.time()
+            if reply is None or reply.get("type") != "pong":
+                raise ConnectionError("Agent did not answer clock ping")
+            if received - sent < best_rtt:
+                best_rtt = received - sent
+                best_offset = reply["time"] - (sent + received) / 2
+        return best_offset
+
+    def dispatch(self, job: Dict[str, Any], start_delay: float = 3.0,
+                 progress_callback: Optional[Callable[[AgentLink], None]] = None) -> float:
+        """Send the job to every agent, scheduled start_delay seconds from now; returns the start time."""
+        start_at = time.time() + start_delay
+        for agent in self.agents:
+            assert agent.channel is not None, "connect() must be called first"
+            agent.channel.send(type="job", job=job, start_at=start_at + agent.clock_offset)
+        for agent in self.agents:
+            reader = threading.Thread(target=self._read_agent, args=(agent, progress_callback),
+                                      name=f"agent-{agent.name}", daemon=True)
+            reader.start()
+            self._readers.append(reader)
+        return start_at
+
+    def _read_agent(self, agent: AgentLink, progress_callback: Optional[Callable[[AgentLink], None]]) -> None:
+        assert agent.channel is not None
+        while not agent.finished:
+            message = agent.channel.receive()
+            if message is None:
+                agent.error = "Connection lost"
+            elif message.get("type") == "progress":
+                agent.clicks = message["clicks"]
+                agent.elapsed = message["elapsed"]
+                if progress_callback is not None:
+                    progress_callback(agent)
+            elif message.get("type") == "result":
+                agent.stats = message["stats"]
+                agent.clicks = agent.stats["clicks"]
+                agent.elapsed = agent.stats["elapsed"]
+            elif message.get("type") == "error":
+                agent.error = message.get("message", "Unknown agent error")
+
+    @property
+    def finished(self) -> bool:
+        """Whether every agent has reported a result or failed."""
+        return all(agent.finished for agent in self.agents)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for all agents to finish; returns False on timeout."""
+        # Poll instead of joining the readers: a KeyboardInterrupt during join() can leave a
+        # thread marked as stopped, which would make later waits return before the results arrive
+        deadline = None if timeout is None else time.time() + timeout
+        while not self.finished:
+            if deadline is not None and time.time() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def broadcast(self, kind: str) -> None:
+        """Send a control message (pause/resume/stop) to every agent still connected."""
+        for agent in self.agents:
+            if agent.channel is not None and not agent.finished:
+                try:
+                    agent.channel.send(type=kind)
+                except OSError as e:
+                    agent.error = f"Connection lost ({e})"
+
+    def pause(self) -> None:
+        """Pause every agent."""
+        self.broadcast("pause")
+
+    def resume(self) -> None:
+        """Resume every agent."""
+        self.broadcast("resume")
+
+    def stop(self) -> None:
+        """Stop every agent."""
+        self.broadcast("stop")
+
+    def report(self) -> Dict[str, Any]:
+        """Combine per-agent statistics into one report."""
+        per_agent = []
+        for agent in self.agents:
+            stats = agent.stats or {}
+            per_agent.append({
+                "agent": agent.name,
+                "clicks": agent.clicks,
+                "elapsed": agent.elapsed,
+                "cps": stats.get("cps", agent.clicks / agent.elapsed if agent.elapsed > 0 else 0.0),
+                "completed": stats.get("completed", False),
+                "stop_reason": stats.get("stop_reason", ""),
+                "error": agent.error,
+            })
+        total_clicks = sum(entry["clicks"] for entry in per_agent)
+        wall_time = max((entry["elapsed"] for entry in per_agent), default=0.0)
+        return {
+            "agents": per_agent,
+            "total_clicks": total_clicks,
+            "wall_time": wall_time,
+            "combined_cps": total_clicks / wall_time if wall_time > 0 else 0.0,
+            "all_completed": all(entry["completed"] and not entry["error"] for entry in per_agent),
+        }
+
+    def close(self) -> None:
+        """Disconnect from every agent."""
+        for agent in self.agents:
+            if agent.channel is not None:
+                agent.channel.close()
+                agent.channel = None
+
+
+def print_cluster_report(report: Dict[str, Any]) -> None:
+    """Print the combined coordinator report."""
+    print(f"\n\nCoordinated clicking completed!")
+    for entry in report["agents"]:
+        status = "✅" if entry["completed"] and not entry["error"] else "⚠️ "
+        detail = entry["error"] or entry["stop_reason"]
+        print(f"  {status} {entry['agent']}: {entry['clicks']:,} clicks in {entry['elapsed']:.2f}s "
+              f"({entry['cps']:.1f} clicks/sec){' - ' + detail if detail else ''}")
+    print(f"Agents: {len(report['agents'])}")
+    print(f"Total clicks performed: {report['total_clicks']:,}")
+    print(f"Wall time: {report['wall_time']:.2f} seconds")
+    print(f"Combined speed: {report['combined_cps']:.1f} clicks per second")
+    if report["all_completed"]:
+        print("✅ All agents completed successfully!")
+    else:
+        print("⚠️  Some agents stopped early or failed.")
+
+
+def run_coordinator(args: argparse.Namespace) -> Dict[str, Any]:
+    """Run a synchronized job across agents; hotkeys and Ctrl+C are broadcast to all of them."""
+    global emergency_stop, is_paused
+    
+    job = {
+        "x": args.x,
+        "y": args.y,
+        "clicks": args.clicks,
+        "duration": args.duration,
+        "delay": args.delay,
+        "turbo_mode": args.turbo_mode,
+        "failsafe": args.failsafe,
+        "verify": {
+            "region": args.verify_region,
+            "interval": args.verify_interval,
+            "every": args.verify_every,
+            "action": args.verify_action,
+            "tolerance": args.verify_tolerance,
+        } if args.verify else None,
+    }
+    coordinator = Coordinator(args.coordinator)
+    try:
+        coordinator.connect()
+        for agent in coordinator.agents:
+            print(f"Connected to agent {agent.name} (clock offset {agent.clock_offset * 1000:+.1f} ms)")
+
+        # Reuse the local hotkeys: their flags are mirrored to every agent below
+        emergency_stop = False
+        is_paused = False
+        setup_hotkeys(args.emergency_hotkey, args.pause_hotkey)
+
+        def show_progress(_agent: AgentLink) -> None:
+            if args.verbose:
+                total = sum(agent.clicks for agent in coordinator.agents)
+                print(f"\rProgress: {total:,} clicks across {len(coordinator.agents)} agents | " +
+                      " | ".join(f"{agent.name}: {agent.clicks:,}" for agent in coordinator.agents),
+                      end="", flush=True)
+
+        coordinator.dispatch(job, args.start_delay, show_progress)
+        print(f"Job dispatched to {len(coordinator.agents)} agents, starting in {args.start_delay}s")
+
+        stop_sent = False
+        paused_sent = False
+        try:
+            while not coordinator.wait(timeout=0.05):
+                if emergency_stop and not stop_sent:
+                    coordinator.stop()
+                    stop_sent = True
+                if is_paused != paused_sent:
+                    if is_paused:
+                        coordinator.pause()
+                    else:
+                        coordinator.resume()
+                    paused_sent = is_paused
+        except KeyboardInterrupt:
+            print("\n\nInterrupted by user (Ctrl+C). Stopping all agents...")
+            coordinator.stop()
+            coordinator.wait(timeout=5.0)
+        finally:
+            cleanup_hotkeys()
+
+        report = coordinator.report()
+        print_cluster_report(report)
+        return report
+    finally:
+        coordinator.close()
 
 
 def main() -> None:
     """Main entry point for the turbo clicker."""
     args = parse_arguments()
     
+    # Agent and coordinator modes
+    if args.agent:
+        run_agent(args.listen[0], args.listen[1], args.backend, args.once)
+        return
+    if args.coordinator:
+        if not args.confirm:
+            mode_str = f"{args.duration} seconds" if args.duration else f"{args.clicks:,} clicks"
+            print(f"\nReady to perform {mode_str} at ({args.x}, {args.y}) on {len(args.coordinator)} agents")
+            response = input("\nDo you want to continue? (y/N): ").lower().strip()
+            if response not in ['y', 'yes']:
+                print("Aborted by user.")
+                sys.exit(0)
+        report = run_coordinator(args)
+        sys.exit(0 if report["all_completed"] else 1)
+    
     # Configuration
-    configure_pyautogui(args.turbo_mode, args.failsafe)
+    if args.backend == 'pyautogui' and not PYAUTOGUI_AVAILABLE:
+        print("Error: PyAutoGUI is not available. Install with: uv add pyautogui")
+        sys.exit(1)
+    if args.backend != 'mock' and PYAUTOGUI_AVAILABLE:
+        configure_pyautogui(args.turbo_mode, args.failsafe)
     
     # Get coordinates
-    click_x, click_y = get_click_coordinates(args.x, args.y)
+    if args.path == 'grid':
+        click_x, click_y = args.path_region[:2]
+    else:
+        click_x, click_y = get_click_coordinates(args.x, args.y)
+    
+    # Precompute the whole motion path up front
+    path = None
+    if args.path:
+        path = build_path(args, (click_x, click_y))
+        if args.clicks is None and args.duration is None:
+            args.clicks = len(path)  # One full sweep
     
     # Confirmation and safety check
     if not args.confirm:
-        mode_str = f"{args.duration} seconds" if args.duration else f"{args.clicks:,} clicks"
-        print(f"\nReady to perform {mode_str} at ({click_x}, {click_y})")
+        if path is not None:
+            mode_str = f"{args.duration} seconds" if args.duration else f"{args.clicks:,} points"
+            print(f"\nReady to {args.path_mode} along a {len(path):,}-point {args.path} path for {mode_str}")
+        else:
+            mode_str = f"{args.duration} seconds" if args.duration else f"{args.clicks:,} clicks"
+            print(f"\nReady to perform {mode_str} at ({click_x}, {click_y})")
         print(f"Turbo mode: {'ON' if args.turbo_mode else 'OFF'}")
         print(f"Delay between clicks: {args.delay}s")
         print(f"FailSafe: {'ON' if args.failsafe else 'OFF'}")
         print(f"Emergency stop: {args.emergency_hotkey.upper()}")
         print(f"Pause/Resume toggle: {args.pause_hotkey.upper()}")
+        print(f"Verification: {'ON (' + args.verify_action + ')' if args.verify else 'OFF'}")
+        print(f"Backend: {args.backend}")
         
         response = input("\nDo you want to continue? (y/N): ").lower().strip()
         if response not in ['y', 'yes']:
             print("Aborted by user.")
             sys.exit(0)
     
+    # Optional on-screen verification around the target
+    verifier = None
+    if args.verify:
+        region = args.verify_region or (click_x - 2, click_y - 2, 5, 5)
+        verifier = ClickVerifier(region, args.verify_interval, args.verify_action, args.verify_tolerance)
+    
     # Start the turbo clicking
     turbo_click(click_x, click_y, args.clicks, args.duration, args.delay, args.verbose, 
-                args.emergency_hotkey, args.pause_hotkey, args.pause_interval)
+                args.emergency_hotkey, args.pause_hotkey, args.pause_interval,
+                verifier, args.verify_every, create_backend(args.backend),
+                path=path, path_mode=args.path_mode, batch_size=args.batch_size)
 
 
 if __name__ == "__main__":